@@ -9,6 +9,12 @@ from ui_approver import approver_page
 from ui_evaluator import evaluator_page
 
 
+@st.cache_resource
+def _ensure_db(db_path: str) -> bool:
+    db.init_db()
+    return True
+
+
 def main():
     st.set_page_config(
         page_title="Promotion Panel",
@@ -16,8 +22,8 @@ def main():
         initial_sidebar_state="expanded",
     )
 
-    # Ensure DB tables exist
-    db.init_db()
+    # Ensure DB tables exist (once per process)
+    _ensure_db(db.DB_PATH)
 
     # Create bootstrap users safely (ADMIN/HRBP/APPROVER) based on secrets/env
     auth.ensure_bootstrap_users()
@@ -55,8 +55,7 @@ def ensure_bootstrap_users() -> None:
         if not username:
             return
 
-        existing = db.user_by_username(username)
-        if existing:
+        if db.username_exists(username):
             return
 
         try:
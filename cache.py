@@ -0,0 +1,104 @@
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+import db
+
+# Read-through caches for lookups that every page repeats on each rerun.
+# st.cache_data is shared by all sessions, so clearing after a write refreshes
+# every user's view. Rows are plain dicts: sqlite3.Row is not picklable.
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def departments() -> list:
+    return [dict(d) for d in db.list_departments()]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def users(include_inactive: bool = True) -> list:
+    # search_key: lowercased text the user searches match against, built once per load
+    out = [dict(u) for u in db.list_users(include_inactive=include_inactive)]
+    for u in out:
+        u["search_key"] = " ".join(str(u[c] or "") for c in ("username", "full_name", "email", "role")).lower()
+    return out
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def evaluations(status: Optional[str] = None) -> list:
+    return [dict(e) for e in db.list_evaluations(status=status)]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def assignments_for_evaluation(eval_id: int) -> list:
+    return [dict(a) for a in db.list_assignments_for_evaluation(eval_id)]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def assigned_evaluations(user_id: int) -> list:
+    return [dict(e) for e in db.list_assigned_evaluations_for_user(user_id)]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def assigned_evaluations_in_departments(user_id: int, departments: tuple) -> list:
+    return [dict(e) for e in db.list_assigned_evaluations_for_user_in_departments(user_id, list(departments))]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def user_evaluation_bundle(eval_id: int, user_id: int) -> dict:
+    # the rating form's own assignment + response; reruns while filling it in hit this
+    mine = db.get_user_evaluation_bundle(eval_id, user_id)
+    return {k: dict(v) if v else None for k, v in mine.items()}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def hrbp_department_names(user_id: int) -> tuple:
+    return tuple(db.get_hrbp_department_names(user_id))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def hrbp_evaluations(user_id: int) -> list:
+    return [dict(e) for e in db.list_evaluations_for_hrbp(user_id)]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def department_hrbps(dept_id: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [dict(u) for u in db.get_department_hrbps(dept_id)],
+        columns=["id", "full_name", "username", "email", "role"],
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def org_report(start_iso: str, end_iso: str) -> pd.DataFrame:
+    rows = db.org_summary_report(start_iso, end_iso)
+    return pd.DataFrame(
+        [(r["target_level"], r["decision"], int(r["cnt"])) for r in rows],
+        columns=["target_level", "decision", "count"],
+    )
+
+
+def clear_users():
+    # assignment and HRBP rows carry the user's name/email/role, so they go stale with users
+    users.clear()
+    assignments_for_evaluation.clear()
+    department_hrbps.clear()
+    hrbp_department_names.clear()
+    hrbp_evaluations.clear()
+    user_evaluation_bundle.clear()
+
+
+def clear_assignments():
+    assignments_for_evaluation.clear()
+    assigned_evaluations.clear()
+    assigned_evaluations_in_departments.clear()
+    user_evaluation_bundle.clear()
+
+
+def clear_evaluations():
+    # the org report counts evaluations by decision, so it follows them
+    evaluations.clear()
+    assigned_evaluations.clear()
+    assigned_evaluations_in_departments.clear()
+    hrbp_evaluations.clear()
+    org_report.clear()
@@ -1,21 +1,59 @@
 import sqlite3
 from contextlib import contextmanager
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Tuple
 import os
+import threading
 import datetime as dt
 
 DB_PATH = os.environ.get("PP_DB_PATH", "app.db")
 
+# list_* helpers annotated Iterator[sqlite3.Row] are generators (see _iter_rows):
+# their results can only be iterated once, so wrap them in list() to reuse them
 
-@contextmanager
-def get_conn():
+# one connection per thread: a Streamlit script run reuses it across every
+# db.* call instead of reconnecting per call
+_local = threading.local()
+
+
+def _connect() -> sqlite3.Connection:
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # WAL (set in init_db) is durable across commits with NORMAL sync
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+@contextmanager
+def get_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _connect()
     try:
         yield conn
         conn.commit()
+    except Exception:
+        # not BaseException: a list_* generator dropped mid-iteration raises
+        # GeneratorExit here, and must not roll back the thread's other work
+        conn.rollback()
+        raise
+
+
+def _iter_rows(cur: sqlite3.Cursor, size: int = 256) -> Iterator[sqlite3.Row]:
+    """
+    Yield a cursor's rows in fetchmany batches instead of one fetchall list.
+    The list_* helpers below are generators built on this: their connection
+    stays open until the caller has consumed (or dropped) the iterator.
+    """
+    try:
+        while True:
+            rows = cur.fetchmany(size)
+            if not rows:
+                return
+            yield from rows
     finally:
-        conn.close()
+        cur.close()
 
 
 def now_iso() -> str:
@@ -29,6 +67,8 @@ def _table_has_column(conn: sqlite3.Connection, table: str, column: str) -> bool
 
 def init_db():
     with get_conn() as conn:
+        # readers no longer wait on a writer; persists in the database file
+        conn.execute("PRAGMA journal_mode=WAL")
         c = conn.cursor()
 
         c.execute("""
@@ -164,12 +204,22 @@ def user_by_username(username: str):
         return conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
 
 
+def username_exists(username: str) -> bool:
+    with get_conn() as conn:
+        return conn.execute("SELECT 1 FROM users WHERE username = ? LIMIT 1", (username,)).fetchone() is not None
+
+
+def all_usernames() -> List[str]:
+    with get_conn() as conn:
+        return [r["username"] for r in conn.execute("SELECT username FROM users").fetchall()]
+
+
 def user_by_id(user_id: int):
     with get_conn() as conn:
         return conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
 
 
-def list_users(include_inactive: bool = True) -> List[sqlite3.Row]:
+def list_users(include_inactive: bool = True) -> Iterator[sqlite3.Row]:
     q = """
     SELECT u.*,
            t.temp_password AS temp_password,
@@ -181,7 +231,7 @@ def list_users(include_inactive: bool = True) -> List[sqlite3.Row]:
         q += " WHERE u.is_active = 1"
     q += " ORDER BY u.created_at DESC"
     with get_conn() as conn:
-        return conn.execute(q).fetchall()
+        yield from _iter_rows(conn.execute(q))
 
 
 def create_user(username: str, full_name: str, email: str, role: str, password_hash: str) -> int:
@@ -196,6 +246,34 @@ def create_user(username: str, full_name: str, email: str, role: str, password_h
         return int(cur.lastrowid)
 
 
+def bulk_create_users(rows: List[dict]) -> int:
+    """
+    Inserts many users (and their temp passwords) in a single transaction.
+    Each row: username, full_name, email, role, password_hash, temp_password.
+    """
+    if not rows:
+        return 0
+    ts = now_iso()
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT INTO users (username, full_name, email, role, password_hash, is_active, created_at)
+            VALUES (?,?,?,?,?,?,?)
+            """,
+            [(r["username"], r["full_name"], r["email"], r["role"], r["password_hash"], 1, ts) for r in rows]
+        )
+        conn.executemany(
+            """
+            INSERT INTO user_temp_passwords (user_id, temp_password, created_at)
+            SELECT id, ?, ? FROM users WHERE username = ?
+            ON CONFLICT(user_id)
+            DO UPDATE SET temp_password=excluded.temp_password, created_at=excluded.created_at
+            """,
+            [(r["temp_password"], ts, r["username"]) for r in rows]
+        )
+    return len(rows)
+
+
 def update_user(user_id: int, full_name: str, email: str, role: str, is_active: int):
     with get_conn() as conn:
         conn.execute(
@@ -315,15 +393,18 @@ def set_department_hrbps(dept_id: int, hrbp_user_ids: List[int]):
     Sets HRBPs for a department. Also auto-upgrades their role to HRBP (requirement).
     """
     hrbp_user_ids = sorted({int(x) for x in hrbp_user_ids})
+    ts = now_iso()
     with get_conn() as conn:
         conn.execute("DELETE FROM hrbp_departments WHERE department_id=?", (int(dept_id),))
-        for uid in hrbp_user_ids:
-            conn.execute(
-                "INSERT OR IGNORE INTO hrbp_departments (hrbp_user_id, department_id, created_at) VALUES (?,?,?)",
-                (uid, int(dept_id), now_iso())
-            )
-            # Auto-set access: user becomes HRBP
-            conn.execute("UPDATE users SET role='HRBP', is_active=1 WHERE id=?", (uid,))
+        if not hrbp_user_ids:
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO hrbp_departments (hrbp_user_id, department_id, created_at) VALUES (?,?,?)",
+            [(uid, int(dept_id), ts) for uid in hrbp_user_ids]
+        )
+        # Auto-set access: users become HRBP
+        placeholders = ",".join(["?"] * len(hrbp_user_ids))
+        conn.execute(f"UPDATE users SET role='HRBP', is_active=1 WHERE id IN ({placeholders})", hrbp_user_ids)
 
 
 def list_hrbp_users(include_inactive: bool = False) -> List[sqlite3.Row]:
@@ -359,7 +440,7 @@ def create_evaluation(candidate_id: str, candidate_name: str, level_path: str, t
         return eval_id
 
 
-def list_evaluations(status: Optional[str] = None) -> List[sqlite3.Row]:
+def list_evaluations(status: Optional[str] = None) -> Iterator[sqlite3.Row]:
     q = "SELECT * FROM evaluations"
     params: Tuple[Any, ...] = ()
     if status:
@@ -367,17 +448,26 @@ def list_evaluations(status: Optional[str] = None) -> List[sqlite3.Row]:
         params = (status,)
     q += " ORDER BY created_at DESC"
     with get_conn() as conn:
-        return conn.execute(q, params).fetchall()
+        yield from _iter_rows(conn.execute(q, params))
 
 
-def list_evaluations_by_departments(departments: List[str]) -> List[sqlite3.Row]:
-    departments = [d.strip() for d in departments if d and d.strip()]
-    if not departments:
-        return []
-    placeholders = ",".join(["?"] * len(departments))
-    q = f"SELECT * FROM evaluations WHERE department IN ({placeholders}) ORDER BY created_at DESC"
+def list_evaluations_for_hrbp(hrbp_user_id: int) -> Iterator[sqlite3.Row]:
+    """
+    Evaluations in the HRBP's mapped departments (trimmed, non-blank names),
+    resolved in one query.
+    """
     with get_conn() as conn:
-        return conn.execute(q, tuple(departments)).fetchall()
+        yield from _iter_rows(conn.execute("""
+            SELECT e.*
+            FROM evaluations e
+            WHERE e.department IN (
+                SELECT TRIM(d.name)
+                FROM hrbp_departments hd
+                JOIN departments d ON d.id = hd.department_id
+                WHERE hd.hrbp_user_id = ? AND TRIM(d.name) <> ''
+            )
+            ORDER BY e.created_at DESC
+        """, (hrbp_user_id,)))
 
 
 def get_evaluation(eval_id: int):
@@ -402,32 +492,35 @@ def create_assignment(eval_id: int, user_id: int, evaluator_role: str):
         )
 
 
-def list_assignments_for_evaluation(eval_id: int):
+_ASSIGNMENTS_FOR_EVALUATION_SQL = """
+    SELECT a.*, u.username, u.full_name, u.email
+    FROM assignments a
+    JOIN users u ON u.id = a.user_id
+    WHERE a.evaluation_id = ?
+    ORDER BY a.created_at ASC
+"""
+
+
+def list_assignments_for_evaluation(eval_id: int) -> Iterator[sqlite3.Row]:
     with get_conn() as conn:
-        return conn.execute("""
-            SELECT a.*, u.username, u.full_name, u.email
-            FROM assignments a
-            JOIN users u ON u.id = a.user_id
-            WHERE a.evaluation_id = ?
-            ORDER BY a.created_at ASC
-        """, (eval_id,)).fetchall()
+        yield from _iter_rows(conn.execute(_ASSIGNMENTS_FOR_EVALUATION_SQL, (eval_id,)))
 
 
-def list_assigned_evaluations_for_user(user_id: int):
+def list_assigned_evaluations_for_user(user_id: int) -> Iterator[sqlite3.Row]:
     with get_conn() as conn:
-        return conn.execute("""
+        yield from _iter_rows(conn.execute("""
             SELECT e.*
             FROM assignments a
             JOIN evaluations e ON e.id = a.evaluation_id
             WHERE a.user_id = ?
             ORDER BY e.created_at DESC
-        """, (user_id,)).fetchall()
+        """, (user_id,)))
 
 
-def list_assigned_evaluations_for_user_in_departments(user_id: int, departments: List[str]):
+def list_assigned_evaluations_for_user_in_departments(user_id: int, departments: List[str]) -> Iterator[sqlite3.Row]:
     departments = [d.strip() for d in departments if d and d.strip()]
     if not departments:
-        return []
+        return
     placeholders = ",".join(["?"] * len(departments))
     q = f"""
         SELECT e.*
@@ -438,7 +531,7 @@ def list_assigned_evaluations_for_user_in_departments(user_id: int, departments:
     """
     params = (user_id, *departments)
     with get_conn() as conn:
-        return conn.execute(q, params).fetchall()
+        yield from _iter_rows(conn.execute(q, params))
 
 
 def get_assignment(eval_id: int, user_id: int):
@@ -477,16 +570,57 @@ def get_response(eval_id: int, user_id: int):
         return conn.execute("SELECT * FROM responses WHERE evaluation_id = ? AND user_id = ?", (eval_id, user_id)).fetchone()
 
 
-def list_responses_for_evaluation(eval_id: int):
+_RESPONSES_FOR_EVALUATION_SQL = """
+    SELECT r.*, u.full_name, u.email, a.evaluator_role
+    FROM responses r
+    JOIN users u ON u.id = r.user_id
+    JOIN assignments a ON a.evaluation_id = r.evaluation_id AND a.user_id = r.user_id
+    WHERE r.evaluation_id = ?
+    ORDER BY r.submitted_at ASC
+"""
+
+
+def list_responses_for_evaluation(eval_id: int) -> Iterator[sqlite3.Row]:
     with get_conn() as conn:
-        return conn.execute("""
-            SELECT r.*, u.full_name, u.email, a.evaluator_role
-            FROM responses r
-            JOIN users u ON u.id = r.user_id
-            JOIN assignments a ON a.evaluation_id = r.evaluation_id AND a.user_id = r.user_id
-            WHERE r.evaluation_id = ?
-            ORDER BY r.submitted_at ASC
-        """, (eval_id,)).fetchall()
+        yield from _iter_rows(conn.execute(_RESPONSES_FOR_EVALUATION_SQL, (eval_id,)))
+
+
+def get_evaluation_bundle(eval_id: int) -> Optional[dict]:
+    """
+    Evaluation row with its assignments, responses and decision, read over one
+    connection.
+    Returns None if the evaluation does not exist.
+    """
+    with get_conn() as conn:
+        ev = conn.execute("SELECT * FROM evaluations WHERE id = ?", (eval_id,)).fetchone()
+        if not ev:
+            return None
+        return {
+            "evaluation": ev,
+            "assignments": conn.execute(_ASSIGNMENTS_FOR_EVALUATION_SQL, (eval_id,)).fetchall(),
+            "responses": conn.execute(_RESPONSES_FOR_EVALUATION_SQL, (eval_id,)).fetchall(),
+            "decision": conn.execute(
+                "SELECT * FROM decisions WHERE evaluation_id = ?", (eval_id,)
+            ).fetchone(),
+        }
+
+
+def get_user_evaluation_bundle(eval_id: int, user_id: int) -> dict:
+    """
+    One evaluator's assignment and response for an evaluation, read over one
+    connection. Either value is None when missing.
+    """
+    with get_conn() as conn:
+        return {
+            "assignment": conn.execute(
+                "SELECT * FROM assignments WHERE evaluation_id = ? AND user_id = ?",
+                (eval_id, user_id)
+            ).fetchone(),
+            "response": conn.execute(
+                "SELECT * FROM responses WHERE evaluation_id = ? AND user_id = ?",
+                (eval_id, user_id)
+            ).fetchone(),
+        }
 
 
 # ---------------- APPROVER RESPONSE ----------------
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Any, Optional
 import os
 import re
 import openpyxl
@@ -9,6 +9,7 @@ import db
 
 # Ratings
 RATING_OPTIONS = ["Demonstrated", "Partially Demonstrated", "Not Demonstrated"]
+DIM_COLUMNS = ("dim1", "dim2", "dim3", "dim4", "dim5", "dim6", "dim7", "dim8")
 
 # Evidence Threshold Evaluation Framework thresholds (from your form logic)
 THRESHOLD_DEMO = 0.70
@@ -233,18 +234,6 @@ def get_weight(level_path: str, evaluator_role: str) -> float:
     return float(LEVEL_WEIGHTS[target].get(evaluator_role, 0.0))
 
 
-def aggregate_dimension_demo_weight(votes: List[Tuple[str, str]], level_path: str) -> float:
-    """
-    Evidence Threshold method (as per your Excel):
-      - sum ONLY weights where rating == Demonstrated
-    """
-    w = 0.0
-    for role, rating in votes:
-        if rating == "Demonstrated":
-            w += get_weight(level_path, role)
-    return w
-
-
 def dimension_result_from_demo_weight(demo_weight: float) -> str:
     if demo_weight >= THRESHOLD_DEMO:
         return "Demonstrated"
@@ -267,21 +256,20 @@ def decision_from_dimension_results(results: List[str], level_path: str) -> str:
     return "Confirmed" if demo_count >= int(min_demo) else "Reject"
 
 
-def committee_aggregate(eval_id: int) -> Dict[str, Any]:
-    ev = db.get_evaluation(eval_id)
-    if not ev:
-        raise ValueError("Evaluation not found")
-
+def aggregate_committee(ev: Any, assignments: List[Any], responses: List[Any]) -> Dict[str, Any]:
+    """
+    Committee aggregation over an already-loaded evaluation, its assignments and
+    its responses (no DB access).
+    Evidence Threshold method (as per your Excel): per dimension, sum ONLY the
+    weights of evaluators who rated it Demonstrated.
+    """
     level_path = ev["level_path"]
     target_level = ev["target_level"]
     rules = get_rules()
 
-    assignments = db.list_assignments_for_evaluation(eval_id)
-    responses = db.list_responses_for_evaluation(eval_id)
-
     # pending if not all assigned submitted
-    all_assigned = {int(a["user_id"]) for a in assignments}
-    responded = {int(r["user_id"]) for r in responses}
+    all_assigned = {a["user_id"] for a in assignments}
+    responded = {r["user_id"] for r in responses}
     if all_assigned and responded != all_assigned:
         return {
             "per_dim": [],
@@ -291,20 +279,20 @@ def committee_aggregate(eval_id: int) -> Dict[str, Any]:
             "assigned_count": len(all_assigned),
         }
 
-    role_by_user = {int(a["user_id"]): a["evaluator_role"] for a in assignments}
+    role_by_user = {a["user_id"]: a["evaluator_role"] for a in assignments}
 
-    per_dim_votes: List[List[Tuple[str, str]]] = [[] for _ in range(8)]
+    # one weight lookup per evaluator, added to every dimension they rated Demonstrated
+    demo_weights = [0.0] * 8
     for r in responses:
-        uid = int(r["user_id"])
-        role = role_by_user.get(uid, "")
-        dims = [r["dim1"], r["dim2"], r["dim3"], r["dim4"], r["dim5"], r["dim6"], r["dim7"], r["dim8"]]
-        for i in range(8):
-            per_dim_votes[i].append((role, dims[i]))
+        w = get_weight(level_path, role_by_user.get(r["user_id"], ""))
+        for i, col in enumerate(DIM_COLUMNS):
+            if r[col] == "Demonstrated":
+                demo_weights[i] += w
 
     per_dim_out = []
     dim_results = []
     for i in range(8):
-        dw = aggregate_dimension_demo_weight(per_dim_votes[i], level_path)
+        dw = demo_weights[i]
         res = dimension_result_from_demo_weight(dw)
         per_dim_out.append({"dimension": rules.dimensions[i], "demo_weight": dw, "result": res})
         dim_results.append(res)
@@ -1,73 +1,199 @@
 import streamlit as st
 import pandas as pd
 import secrets
-import string
 import io
+import os
+import itertools
+import functools
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import openpyxl
+import xlsxwriter
+
+try:
+    import python_calamine  # optional, Rust-backed xlsx reader
+    _EXCEL_READ_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_READ_ENGINE = "openpyxl"
 
 import db
 import auth
+import cache
 import logic
 
 
+ROLE_CHOICES = ("ADMIN", "HRBP", "APPROVER", "EVALUATOR")
+ROLE_SET = frozenset(ROLE_CHOICES)
+ROLE_INDEX = {r: i for i, r in enumerate(ROLE_CHOICES)}
+IMPORT_COLUMNS = frozenset(("username", "full_name", "email", "role", "password"))
+DEPT_PREVIEW_ROWS = 10_000
+
+
 def _gen_password(n: int = 10) -> str:
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(n))
+    # one CSPRNG draw; base64url chars carry 6 bits each, so n chars ~ same entropy as before
+    return secrets.token_urlsafe(n)[:n]
+
+
+def _gen_passwords(count: int, n: int = 10) -> list:
+    # bulk variant: a single CSPRNG draw sliced into `count` passwords of n chars
+    pool = secrets.token_urlsafe(n * count)
+    return [pool[i * n:(i + 1) * n] for i in range(count)]
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
 def _to_excel_bytes(df: pd.DataFrame, sheet_name: str) -> bytes:
+    # cached on the frame's content: download buttons need bytes on every rerun
+    # xlsxwriter streams row by row (constant_memory needs strict row order,
+    # which df.to_excel does not guarantee, so rows are written directly)
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name=sheet_name)
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    wb = xlsxwriter.Workbook(output, {"constant_memory": True, "strings_to_urls": False})
+    ws = wb.add_worksheet(sheet_name)
+    ws.write_row(0, 0, [str(c) for c in df.columns])
+    for i, row in enumerate(rows, start=1):
+        ws.write_row(i, 0, row)
+    wb.close()
     return output.getvalue()
 
 
-def _read_user_import(file) -> pd.DataFrame:
-    name = file.name.lower()
-    if name.endswith(".csv"):
-        df = pd.read_csv(file)
-    else:
-        df = pd.read_excel(file)
-    df.columns = [str(c).strip().lower() for c in df.columns]
-    return df
-
-
-def _role_choices():
-    return ["ADMIN", "HRBP", "APPROVER", "EVALUATOR"]
+@st.cache_data(show_spinner=False, max_entries=16)
+def _to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    output = io.BytesIO()
+    df.to_parquet(output, index=False)
+    return output.getvalue()
 
 
+def _hash_passwords(passwords: list) -> list:
+    # bcrypt releases the GIL, so hashing a batch parallelizes across threads
+    if len(passwords) < 2:
+        return [auth.hash_password(p) for p in passwords]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return list(ex.map(auth.hash_password, passwords))
+
+
+def _xlsx_rows(buf):
+    # stream the first sheet as plain value rows (header first); neither reader
+    # builds cell/style objects the way a full workbook load does
+    if _EXCEL_READ_ENGINE == "calamine":
+        yield from python_calamine.CalamineWorkbook.from_filelike(buf).get_sheet_by_index(0).iter_rows()
+        return
+    wb = openpyxl.load_workbook(buf, read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _cell(v):
+    # same values pd.read_excel would give: blank -> None, integral float -> int
+    if v == "":
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
+
+def _iter_user_import(file, chunksize: int = 10_000):
+    # parse straight from the upload buffer and keep only the import columns,
+    # yielding bounded chunks for both CSV and xlsx
+    buf = io.BytesIO(file.getbuffer())
+    if file.name.lower().endswith(".csv"):
+        usecols = lambda c: str(c).strip().lower() in IMPORT_COLUMNS
+        for df in pd.read_csv(buf, usecols=usecols, dtype="string", chunksize=chunksize):
+            df.columns = [str(c).strip().lower() for c in df.columns]
+            yield df
+        return
+
+    rows = _xlsx_rows(buf)
+    header = [str(c).strip().lower() for c in next(rows, ())]
+    keep = [i for i, c in enumerate(header) if c in IMPORT_COLUMNS]
+    columns = [header[i] for i in keep]
+    yielded = False
+    while True:
+        raw = list(itertools.islice(rows, chunksize))
+        if not raw:
+            break
+        block = [[_cell(r[i]) if i < len(r) else None for i in keep] for r in raw]
+        yield pd.DataFrame([b for b in block if any(v is not None for v in b)], columns=columns)
+        yielded = True
+    # header-only sheet: still hand back the columns so the caller's column check sees them
+    if not yielded:
+        yield pd.DataFrame(columns=columns)
+
+
+def _validate_user_import(dfu: pd.DataFrame, existing: set):
+    """
+    Vectorized cleaning/validation of an imported users frame.
+    Returns (good, skipped): rows to create (defaults filled) and a username/reason frame.
+    """
+    dfu = dfu.copy()
+    for c in ("username", "full_name", "email", "password"):
+        dfu[c] = dfu[c].astype("string").fillna("").str.strip()
+    dfu["username"] = dfu["username"].str.lower()
+    dfu["role"] = dfu["role"].astype("string").fillna("").str.strip().str.upper()
+
+    empty = dfu["username"].eq("")
+    exists = dfu["username"].isin(existing)
+    bad_role = ~dfu["role"].isin(ROLE_SET)
+    ok = ~(empty | exists | bad_role)
+    # a username repeated inside the file is created once (first valid row wins)
+    dup = ok & dfu["username"].where(ok).duplicated()
+    ok &= ~dup
+
+    reason = pd.Series("", index=dfu.index)
+    reason = reason.mask(bad_role, "invalid role: " + dfu["role"])
+    reason = reason.mask(exists | dup, "already exists")
+    reason = reason.mask(empty, "empty username")
+    skipped = pd.DataFrame({"username": dfu["username"], "reason": reason})[~ok].reset_index(drop=True)
+
+    good = dfu.loc[ok, ["username", "full_name", "email", "role", "password"]]
+    good["full_name"] = good["full_name"].mask(good["full_name"].eq(""), good["username"])
+    good["email"] = good["email"].mask(good["email"].eq(""), good["username"] + "@example.com")
+    return good.reset_index(drop=True), skipped
+
+
+def _filter_users_frame(df: pd.DataFrame, q: str) -> pd.DataFrame:
+    """Vectorized substring filter on the precomputed (lowercase) search_key column."""
+    if not q or df.empty:
+        return df
+    return df[df["search_key"].str.contains(q, regex=False, na=False)]
+
+
+@functools.lru_cache(maxsize=256)
 def _iso(d: dt.date) -> str:
-    return dt.datetime(d.year, d.month, d.day).isoformat(timespec="seconds")
+    # date_input values only change when a new date is picked, so reruns hit the cache
+    return dt.datetime.combine(d, dt.time.min).isoformat(timespec="seconds")
 
 
-def _read_departments_excel(file) -> list:
-    df = pd.read_excel(file)
-    cols = list(df.columns)
+def _department_cells(file, limit: Optional[int] = None) -> list:
+    # one streaming pass: pick the department column from the header,
+    # then only pull that cell from each following row (stopping after `limit` rows)
+    rows = _xlsx_rows(io.BytesIO(file.getbuffer()))
+    cols = [str(c).strip().lower() for c in next(rows, ())]
+    if not cols:
+        return []
 
-    preferred = None
-    for c in cols:
-        if str(c).strip().lower() == "dept level 2":
-            preferred = c
-            break
-    if preferred is None:
-        for c in cols:
-            cl = str(c).strip().lower()
-            if "dept" in cl or "department" in cl:
-                preferred = c
-                break
-    if preferred is None and cols:
-        preferred = cols[0]
+    preferred = next((i for i, c in enumerate(cols) if c == "dept level 2"), None)
     if preferred is None:
-        return []
+        preferred = next((i for i, c in enumerate(cols) if "dept" in c or "department" in c), 0)
+
+    if limit is not None:
+        rows = itertools.islice(rows, limit)
+    return [_cell(r[preferred]) if preferred < len(r) else None for r in rows]
 
-    return df[preferred].tolist()
+
+def _read_departments_excel(file, limit: int = DEPT_PREVIEW_ROWS) -> list:
+    s = pd.Series(_department_cells(file, limit), dtype=object).astype("string").fillna("").str.strip()
+    s = s[s.str.len() > 0]
+    return s.drop_duplicates().tolist()
 
 
 def admin_page():
     auth.require_roles("ADMIN")
     st.header("Admin Dashboard")
 
-    db.init_db()
     rules = logic.get_rules()
 
     tabs = st.tabs([
@@ -88,18 +214,20 @@ def admin_page():
         up = st.file_uploader("Upload departments.xlsx", type=["xlsx"])
         if up is not None:
             try:
-                names = _read_departments_excel(up)
-                preview = [str(x).strip() for x in names if str(x).strip()]
+                preview = _read_departments_excel(up)
                 st.write(f"Found **{len(preview)}** department rows in file.")
+                st.caption(f"Preview scans the first {DEPT_PREVIEW_ROWS:,} rows; import reads the whole file.")
                 st.dataframe(pd.DataFrame({"department_name": preview}).head(50), use_container_width=True)
 
                 if st.button("Import departments from file", type="primary"):
-                    stats = db.bulk_upsert_departments(preview)
+                    # full streaming pass straight into the DB; bulk_upsert_departments cleans/dedupes
+                    stats = db.bulk_upsert_departments(_department_cells(up))
+                    # later sections re-read the cleared cache in this same run, so no st.rerun()
+                    cache.departments.clear()
                     st.success(
                         f"Imported successfully. Created={stats['created']} | "
                         f"Skipped(existing)={stats['skipped_existing']} | Cleaned={stats['cleaned']}"
                     )
-                    st.rerun()
             except Exception as e:
                 st.error(f"Could not read/import file: {e}")
 
@@ -114,29 +242,30 @@ def admin_page():
                     st.error("Department name is required.")
                 else:
                     db.create_department(new_dept.strip())
+                    cache.departments.clear()
                     st.success("Added.")
-                    st.rerun()
 
         st.divider()
         st.markdown("### Current departments")
-        depts = db.list_departments()
+        depts = cache.departments()
         if not depts:
             st.info("No departments yet.")
         else:
-            df = pd.DataFrame([{"id": int(d["id"]), "name": d["name"]} for d in depts])
+            df = pd.DataFrame([{"id": d["id"], "name": d["name"]} for d in depts])
             st.dataframe(df, use_container_width=True)
 
     # -------------------- Department ↔ HRBP Mapping (NEW) --------------------
     with tabs[1]:
         st.subheader("Department ↔ HRBP Mapping")
-        depts = db.list_departments()
+        depts = cache.departments()
         if not depts:
             st.warning("Import/create departments first.")
         else:
+            dept_name_by_id = {d["id"]: d["name"] for d in depts}
             dept_id = st.selectbox(
                 "Select department",
-                options=[int(d["id"]) for d in depts],
-                format_func=lambda i: next((d["name"] for d in depts if int(d["id"]) == int(i)), str(i))
+                options=list(dept_name_by_id),
+                format_func=dept_name_by_id.get
             )
 
             # Eligible users: all active non-admin users (admin can't be HRBP)
@@ -144,33 +273,26 @@ def admin_page():
             if not eligible:
                 st.warning("No eligible users found. Create users in Access Management first.")
             else:
-                current_hrbps = db.get_department_hrbps(int(dept_id))
-                current_ids = [int(u["id"]) for u in current_hrbps]
+                current_hrbps = cache.department_hrbps(dept_id)
+                current_ids = current_hrbps["id"].tolist()
 
                 # Show current
-                if current_hrbps:
+                if not current_hrbps.empty:
                     st.caption("Current HRBPs for this department:")
-                    st.dataframe(pd.DataFrame([{
-                        "full_name": u["full_name"],
-                        "username": u["username"],
-                        "email": u["email"],
-                        "role": u["role"],
-                    } for u in current_hrbps]), use_container_width=True)
+                    st.dataframe(current_hrbps.drop(columns="id"), use_container_width=True)
                 else:
                     st.info("No HRBP assigned to this department yet.")
 
-                options = [int(u["id"]) for u in eligible]
-                def fmt(uid: int) -> str:
-                    u = next((x for x in eligible if int(x["id"]) == int(uid)), None)
-                    if not u:
-                        return str(uid)
-                    return f"{u['full_name']} ({u['username']}) | {u['email']} | role={u['role']}"
+                eligible_label = {
+                    u["id"]: f"{u['full_name']} ({u['username']}) | {u['email']} | role={u['role']}"
+                    for u in eligible
+                }
 
                 selected_ids = st.multiselect(
                     "Select one or more HRBPs for this department",
-                    options=options,
+                    options=list(eligible_label),
                     default=current_ids,
-                    format_func=fmt
+                    format_func=eligible_label.get
                 )
 
                 st.warning(
@@ -178,7 +300,8 @@ def admin_page():
                 )
 
                 if st.button("Save Department HRBPs", type="primary"):
-                    db.set_department_hrbps(int(dept_id), selected_ids)
+                    db.set_department_hrbps(dept_id, selected_ids)
+                    cache.clear_users()
                     st.success("Saved. HRBP access updated automatically.")
                     st.rerun()
 
@@ -190,27 +313,28 @@ def admin_page():
 
         # Create user
         with sub_tabs[0]:
-            username = st.text_input("Username (unique)", placeholder="e.g. milad.ahmadkhan")
-            full_name = st.text_input("Full name")
-            email = st.text_input("Email")
-            role = st.selectbox("Role", _role_choices(), index=_role_choices().index("EVALUATOR"))
-
             if "suggested_pass" not in st.session_state:
                 st.session_state["suggested_pass"] = _gen_password()
 
-            col1, col2 = st.columns([2, 1])
-            with col1:
+            # buttons other than the submit button can't live inside a form
+            if st.button("Regenerate suggested password"):
+                st.session_state["suggested_pass"] = _gen_password()
+                st.rerun()
+
+            # form: typing into the fields does not rerun the page; only submit does
+            with st.form("create_user"):
+                username = st.text_input("Username (unique)", placeholder="e.g. milad.ahmadkhan")
+                full_name = st.text_input("Full name")
+                email = st.text_input("Email")
+                role = st.selectbox("Role", ROLE_CHOICES, index=ROLE_INDEX["EVALUATOR"])
                 password = st.text_input("Password (auto-suggested, editable)", value=st.session_state["suggested_pass"])
-            with col2:
-                if st.button("Regenerate", use_container_width=True):
-                    st.session_state["suggested_pass"] = _gen_password()
-                    st.rerun()
+                submitted = st.form_submit_button("Create user", type="primary")
 
-            if st.button("Create user", type="primary"):
+            if submitted:
                 u = (username or "").strip().lower()
                 if not u:
                     st.error("Username is required.")
-                elif db.user_by_username(u):
+                elif db.username_exists(u):
                     st.error("Username already exists.")
                 else:
                     uid = db.create_user(
@@ -221,6 +345,7 @@ def admin_page():
                         password_hash=auth.hash_password(password.strip() or "changeme"),
                     )
                     db.set_temp_password(uid, password.strip() or "changeme")
+                    cache.clear_users()
                     st.success(f"User created: {u}")
                     st.session_state["suggested_pass"] = _gen_password()
                     st.rerun()
@@ -244,45 +369,38 @@ def admin_page():
 
             upu = st.file_uploader("Upload users Excel/CSV", type=["xlsx", "csv"], key="users_uploader")
             if upu is not None:
-                dfu = _read_user_import(upu)
+                chunks = _iter_user_import(upu)
+                first = next(chunks, pd.DataFrame())
                 required = {"username", "full_name", "email", "role"}
-                missing = [c for c in required if c not in dfu.columns]
+                missing = [c for c in required if c not in first.columns]
                 if missing:
                     st.error(f"Missing columns: {missing}")
                 else:
-                    if "password" not in dfu.columns:
-                        dfu["password"] = ""
-
-                    created_rows, skipped_rows = [], []
-                    for _, row in dfu.iterrows():
-                        u = str(row.get("username", "")).strip().lower()
-                        if not u:
-                            skipped_rows.append({"username": "", "reason": "empty username"})
-                            continue
-                        if db.user_by_username(u):
-                            skipped_rows.append({"username": u, "reason": "already exists"})
-                            continue
-
-                        r = str(row.get("role", "")).strip().upper()
-                        if r not in _role_choices():
-                            skipped_rows.append({"username": u, "reason": f"invalid role: {r}"})
-                            continue
-
-                        pwd = str(row.get("password", "")).strip() or _gen_password()
-                        uid = db.create_user(
-                            username=u,
-                            full_name=str(row.get("full_name", "")).strip() or u,
-                            email=str(row.get("email", "")).strip() or f"{u}@example.com",
-                            role=r,
-                            password_hash=auth.hash_password(pwd),
-                        )
-                        db.set_temp_password(uid, pwd)
+                    # one query for all existing usernames instead of one lookup per row;
+                    # kept up to date so repeats across chunks are still skipped
+                    existing = set(db.all_usernames())
+                    created_rows, skipped_parts = [], []
+                    for dfu in itertools.chain([first], chunks):
+                        if "password" not in dfu.columns:
+                            dfu["password"] = ""
+                        good, skipped = _validate_user_import(dfu, existing)
+                        skipped_parts.append(skipped)
+
+                        # only password generation/hashing is left per row
+                        blank = good["password"].eq("")
+                        good.loc[blank, "password"] = _gen_passwords(int(blank.sum()))
+                        rows = good.to_dict("records")
+                        hashes = _hash_passwords(good["password"].tolist())
+                        db.bulk_create_users([
+                            {**r, "password_hash": h, "temp_password": r["password"]}
+                            for r, h in zip(rows, hashes)
+                        ])
+                        existing.update(good["username"])
+                        created_rows += rows
 
-                        created_rows.append({
-                            "username": u, "full_name": str(row.get("full_name", "")).strip() or u,
-                            "email": str(row.get("email", "")).strip() or f"{u}@example.com",
-                            "role": r, "password": pwd
-                        })
+                    if created_rows:
+                        cache.clear_users()
+                    skipped = pd.concat(skipped_parts, ignore_index=True)
 
                     if created_rows:
                         out_df = pd.DataFrame(created_rows)
@@ -294,9 +412,9 @@ def admin_page():
                             file_name="created_users_with_passwords.xlsx",
                             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         )
-                    if skipped_rows:
-                        st.warning(f"Skipped {len(skipped_rows)} rows.")
-                        st.dataframe(pd.DataFrame(skipped_rows), use_container_width=True)
+                    if not skipped.empty:
+                        st.warning(f"Skipped {len(skipped)} rows.")
+                        st.dataframe(skipped, use_container_width=True)
 
         # Users list edit/delete
         with sub_tabs[2]:
@@ -305,26 +423,18 @@ def admin_page():
             show_inactive = st.checkbox("Show inactive users", value=True)
             q = st.text_input("Search users", placeholder="username / name / email").strip().lower()
 
-            users = db.list_users(include_inactive=show_inactive)
-            filtered = []
-            for u in users:
-                label = f"{u['username']} {u['full_name']} {u['email']} {u['role']}".lower()
-                if q and q not in label:
-                    continue
-                filtered.append(u)
+            users_df = pd.DataFrame(
+                cache.users(include_inactive=show_inactive),
+                columns=["id", "username", "full_name", "email", "role", "is_active", "temp_password", "search_key"],
+            )
+            users_df = _filter_users_frame(users_df, q).drop(columns="search_key")
 
-            if not filtered:
+            if users_df.empty:
                 st.info("No users match your filter.")
             else:
-                df_list = pd.DataFrame([{
-                    "id": int(u["id"]),
-                    "username": u["username"],
-                    "full_name": u["full_name"],
-                    "email": u["email"],
-                    "role": u["role"],
-                    "is_active": int(u["is_active"]),
-                    "temp_password": u["temp_password"] or "",
-                } for u in filtered])
+                df_list = users_df.assign(temp_password=users_df["temp_password"].fillna("")).reset_index(drop=True)
+                # low-cardinality columns: category dtype keeps the frame small for display/export
+                df_list = df_list.astype({"role": "category", "is_active": "category"})
                 st.dataframe(df_list, use_container_width=True)
 
                 st.download_button(
@@ -333,16 +443,26 @@ def admin_page():
                     file_name="users_access_list.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 )
+                st.download_button(
+                    "Download users (Parquet)",
+                    data=_to_parquet_bytes(df_list),
+                    file_name="users_access_list.parquet",
+                    mime="application/vnd.apache.parquet",
+                )
 
                 st.divider()
                 st.markdown("### Edit or Delete a user")
 
+                listed_label = {
+                    u["id"]: f"{u['full_name']} ({u['username']}) | {u['role']}"
+                    for u in df_list.to_dict("records")
+                }
                 user_id = st.selectbox(
                     "Select user",
-                    options=[int(u["id"]) for u in filtered],
-                    format_func=lambda uid: next((f"{u['full_name']} ({u['username']}) | {u['role']}" for u in filtered if int(u["id"]) == int(uid)), str(uid))
+                    options=list(listed_label),
+                    format_func=listed_label.get
                 )
-                u0 = db.user_by_id(int(user_id))
+                u0 = db.user_by_id(user_id)
                 if not u0:
                     st.error("User not found.")
                 else:
@@ -351,12 +471,13 @@ def admin_page():
                         full_name = st.text_input("Full name", value=u0["full_name"])
                         email = st.text_input("Email", value=u0["email"])
                     with col2:
-                        role = st.selectbox("Role", _role_choices(), index=_role_choices().index(u0["role"]))
-                        is_active = st.checkbox("Active", value=bool(int(u0["is_active"])))
+                        role = st.selectbox("Role", ROLE_CHOICES, index=ROLE_INDEX.get(u0["role"], ROLE_INDEX["EVALUATOR"]))
+                        is_active = st.checkbox("Active", value=bool(u0["is_active"]))
 
                     if st.button("Save changes", type="primary"):
                         # prevent accidentally demoting ADMIN via UI for the main admin user, but still allow if you insist
-                        db.update_user(int(user_id), full_name.strip(), email.strip(), role, int(is_active))
+                        db.update_user(user_id, full_name.strip(), email.strip(), role, int(is_active))
+                        cache.clear_users()
                         st.success("User updated.")
                         st.rerun()
 
@@ -365,26 +486,30 @@ def admin_page():
                         if u0["role"] == "ADMIN":
                             st.error("Deleting ADMIN user is blocked to avoid locking yourself out.")
                         else:
-                            db.delete_user(int(user_id))
+                            db.delete_user(user_id)
+                            cache.clear_users()
                             st.success("User deleted.")
                             st.rerun()
 
     # -------------------- CREATE EVALUATION --------------------
     with tabs[3]:
         st.subheader("Create Evaluation")
-        depts = db.list_departments()
+        depts = cache.departments()
         if not depts:
             st.warning("Please import/create departments first.")
         else:
-            candidate_id = st.text_input("Candidate ID", placeholder="e.g. DK-12345")
-            candidate_name = st.text_input("Candidate Name")
-            department = st.selectbox("Department", options=[d["name"] for d in depts])
-
+            # outside the form so the derived target level updates as soon as the path changes
             level_path = st.selectbox("Promotion Path (from Sheet2)", rules.level_paths)
             target_level = logic.level_path_to_target_level(level_path)
             st.caption(f"Target level derived: **{target_level}**")
 
-            if st.button("Create Evaluation", type="primary"):
+            with st.form("create_evaluation"):
+                candidate_id = st.text_input("Candidate ID", placeholder="e.g. DK-12345")
+                candidate_name = st.text_input("Candidate Name")
+                department = st.selectbox("Department", options=[d["name"] for d in depts])
+                submitted = st.form_submit_button("Create Evaluation", type="primary")
+
+            if submitted:
                 if not candidate_id.strip() or not candidate_name.strip():
                     st.error("Candidate ID and Name are required.")
                 else:
@@ -396,68 +521,73 @@ def admin_page():
                         department=department,
                         created_by=auth.current_user()["id"],
                     )
+                    cache.clear_evaluations()
                     st.success(f"Evaluation created (ID: {eval_id})")
 
     # -------------------- ASSIGN EVALUATORS --------------------
     with tabs[4]:
         st.subheader("Assign Evaluators")
-        evals = db.list_evaluations()
+        evals = cache.evaluations()
+        evals_by_id = {e["id"]: e for e in evals}
         if not evals:
             st.info("No evaluations yet.")
         else:
             q = st.text_input("Search candidate", placeholder="type to filter candidate list...").strip().lower()
 
-            def _eval_label(e):
-                dept = e["department"] or "-"
-                return f"{e['candidate_name']} | {dept} | {e['level_path']} | #{e['id']}"
-
-            filtered = [e for e in evals if (not q) or q in _eval_label(e).lower() or q in str(e["candidate_id"]).lower()]
-            if not filtered:
+            eval_label = {
+                e["id"]: f"{e['candidate_name']} | {e['department'] or '-'} | {e['level_path']} | #{e['id']}"
+                for e in evals
+            }
+            if q:
+                # str.lower() folds any Unicode case, unlike SQLite LIKE
+                eval_label = {
+                    eid: label for eid, label in eval_label.items()
+                    if q in label.lower() or q in (evals_by_id[eid]["candidate_id"] or "").lower()
+                }
+            if not eval_label:
                 st.warning("No evaluations match your search.")
             else:
                 eval_id = st.selectbox(
                     "Select evaluation",
-                    options=[e["id"] for e in filtered],
-                    format_func=lambda eid: _eval_label(db.get_evaluation(eid))
+                    options=list(eval_label),
+                    format_func=eval_label.get
                 )
-                ev = db.get_evaluation(int(eval_id))
+                ev = evals_by_id[eval_id]
                 allowed_roles = logic.allowed_evaluator_roles_by_level_path(ev["level_path"])
                 st.caption(f"Allowed evaluator roles: {', '.join(allowed_roles)}")
 
-                users = db.list_users(include_inactive=False)
-                eligible = [u for u in users if int(u["is_active"]) == 1 and u["role"] != "ADMIN"]
+                users_df = pd.DataFrame(
+                    cache.users(include_inactive=False),
+                    columns=["id", "username", "full_name", "email", "role", "is_active", "search_key"],
+                )
+                eligible_df = users_df[(users_df["is_active"] == 1) & (users_df["role"] != "ADMIN")]
 
                 uq = st.text_input("Search user", placeholder="username/name/email...").strip().lower()
-                eligible_filtered = []
-                for u in eligible:
-                    s = f"{u['username']} {u['full_name']} {u['email']} {u['role']}".lower()
-                    if not uq or uq in s:
-                        eligible_filtered.append(u)
-
-                user_id = st.selectbox(
-                    "Select user to assign",
-                    options=[int(u["id"]) for u in eligible_filtered],
-                    format_func=lambda uid: next(
-                        (f"{u['full_name']} ({u['username']}) - {u['email']} | role={u['role']}"
-                         for u in eligible_filtered if int(u["id"]) == int(uid)),
-                        str(uid)
+                assignable_label = {
+                    u["id"]: f"{u['full_name']} ({u['username']}) - {u['email']} | role={u['role']}"
+                    for u in _filter_users_frame(eligible_df, uq).to_dict("records")
+                }
+
+                with st.form("assign_evaluator"):
+                    user_id = st.selectbox(
+                        "Select user to assign",
+                        options=list(assignable_label),
+                        format_func=assignable_label.get
                     )
-                )
-
-                evaluator_role = st.selectbox("Evaluator role for this evaluation", allowed_roles)
-                if st.button("Assign evaluator", type="primary"):
-                    db.create_assignment(int(eval_id), int(user_id), evaluator_role)
+                    evaluator_role = st.selectbox("Evaluator role for this evaluation", allowed_roles)
+                    submitted = st.form_submit_button("Assign evaluator", type="primary")
+
+                if submitted and user_id is None:
+                    st.warning("No user selected. Adjust the search and pick a user to assign.")
+                elif submitted:
+                    db.create_assignment(eval_id, user_id, evaluator_role)
+                    cache.clear_assignments()
                     st.success("Assigned.")
-                    st.rerun()
 
-                assigns = db.list_assignments_for_evaluation(int(eval_id))
+                assigns = cache.assignments_for_evaluation(eval_id)
                 if assigns:
-                    df = pd.DataFrame([{
-                        "Name": a["full_name"],
-                        "Email": a["email"],
-                        "Username": a["username"],
-                        "Evaluator Role": a["evaluator_role"],
-                    } for a in assigns])
+                    df = pd.DataFrame(assigns, columns=["full_name", "email", "username", "evaluator_role"])
+                    df.columns = ["Name", "Email", "Username", "Evaluator Role"]
                     st.dataframe(df, use_container_width=True)
 
     # -------------------- ORG REPORTS --------------------
@@ -466,20 +596,23 @@ def admin_page():
         today = dt.date.today()
         default_start = today - dt.timedelta(days=183)
 
-        c1, c2 = st.columns(2)
-        with c1:
-            start_date = st.date_input("Start date", value=default_start)
-        with c2:
-            end_date = st.date_input("End date (exclusive)", value=today + dt.timedelta(days=1))
-
-        rows = db.org_summary_report(_iso(start_date), _iso(end_date))
-        if not rows:
+        # form: picking dates does not rerun the page; one query per submitted range (cached)
+        with st.form("org_report_range"):
+            c1, c2 = st.columns(2)
+            with c1:
+                start_date = st.date_input("Start date", value=default_start)
+            with c2:
+                end_date = st.date_input("End date (exclusive)", value=today + dt.timedelta(days=1))
+            st.form_submit_button("Run report")
+
+        df = cache.org_report(_iso(start_date), _iso(end_date))
+        if df.empty:
             st.info("No data in this range.")
         else:
-            df = pd.DataFrame([{"target_level": r["target_level"], "decision": r["decision"], "count": int(r["cnt"])} for r in rows])
             st.dataframe(df, use_container_width=True)
 
-            pivot = df.pivot_table(index="target_level", columns="decision", values="count", aggfunc="sum", fill_value=0).reset_index()
+            # SQL already grouped by (target_level, decision): reshape only, no aggregation
+            pivot = df.pivot(index="target_level", columns="decision", values="count").fillna(0).astype(int).reset_index()
             st.markdown("### Pivot view")
             st.dataframe(pivot, use_container_width=True)
 
@@ -489,26 +622,32 @@ def admin_page():
                 file_name=f"org_report_{start_date}_to_{end_date}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
+            st.download_button(
+                "Download report (Parquet)",
+                data=_to_parquet_bytes(df),
+                file_name=f"org_report_{start_date}_to_{end_date}.parquet",
+                mime="application/vnd.apache.parquet",
+            )
 
     # -------------------- MONITOR & CLOSE --------------------
     with tabs[6]:
         st.subheader("Monitor & Close")
-        evals = db.list_evaluations()
+        evals = cache.evaluations()
         if not evals:
             st.info("No evaluations yet.")
         else:
+            monitor_label = {
+                e["id"]: f"#{e['id']} | {e['candidate_name']} | {e['department'] or '-'} | {e['level_path']} | {e['status']}"
+                for e in evals
+            }
             eval_id = st.selectbox(
                 "Select Evaluation",
-                options=[e["id"] for e in evals],
-                format_func=lambda eid: (
-                    f"#{eid} | {db.get_evaluation(eid)['candidate_name']} | "
-                    f"{db.get_evaluation(eid)['department'] or '-'} | "
-                    f"{db.get_evaluation(eid)['level_path']} | {db.get_evaluation(eid)['status']}"
-                )
+                options=list(monitor_label),
+                format_func=monitor_label.get
             )
-            ev = db.get_evaluation(int(eval_id))
-            assigns = db.list_assignments_for_evaluation(int(eval_id))
-            responses = db.list_responses_for_evaluation(int(eval_id))
+            # evaluation, assignments and responses in one round-trip
+            bundle = db.get_evaluation_bundle(eval_id)
+            ev, assigns, responses = bundle["evaluation"], bundle["assignments"], bundle["responses"]
 
             st.write(f"**Candidate:** {ev['candidate_name']} ({ev['candidate_id']})")
             st.write(f"**Department:** {ev['department'] or '-'}")
@@ -516,24 +655,27 @@ def admin_page():
             st.write(f"**Status:** {ev['status']}")
             st.write(f"Assigned: **{len(assigns)}** | Submitted: **{len(responses)}**")
 
-            agg = logic.committee_aggregate(int(eval_id))
+            # aggregate the bundle's rows without re-querying
+            agg = logic.aggregate_committee(ev, assigns, responses)
             if agg["committee_decision"] == "Pending":
                 st.info(f"Pending: {agg['responded_count']}/{agg['assigned_count']} submitted.")
             else:
                 st.success(f"Committee Decision: **{agg['committee_decision']}**")
 
             if st.button("Recompute committee decision"):
-                agg = logic.committee_aggregate(int(eval_id))
-                db.set_decision(int(eval_id), committee_decision=agg["committee_decision"])
+                db.set_decision(eval_id, committee_decision=agg["committee_decision"])
+                cache.org_report.clear()
                 st.success("Recomputed & saved committee decision.")
 
             if ev["target_level"] in ("Principal", "Distinguished"):
                 if st.button("Move to Approver (READY_FOR_APPROVER)", type="primary"):
-                    db.set_evaluation_status(int(eval_id), "READY_FOR_APPROVER")
+                    db.set_evaluation_status(eval_id, "READY_FOR_APPROVER")
+                    cache.clear_evaluations()
                     st.success("Moved to READY_FOR_APPROVER.")
                     st.rerun()
             else:
                 if st.button("Close evaluation (CLOSED)", type="primary"):
-                    db.set_evaluation_status(int(eval_id), "CLOSED")
+                    db.set_evaluation_status(eval_id, "CLOSED")
+                    cache.clear_evaluations()
                     st.success("Closed.")
                     st.rerun()
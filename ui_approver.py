@@ -1,7 +1,9 @@
 import streamlit as st
 import auth
+import cache
 import db
 import logic
+import ui_tables
 import pandas as pd
 
 
@@ -11,18 +13,21 @@ def approver_page():
     st.caption("For Principal / Distinguished: review all evaluator votes and submit final per-dimension decision.")
 
     rules = logic.get_rules()
+    dim_names = tuple(rules.dimensions[:8])
 
-    evals = db.list_evaluations(status="READY_FOR_APPROVER")
+    evals = cache.evaluations(status="READY_FOR_APPROVER")
     if not evals:
         st.info("No evaluations waiting for approval.")
         return
 
+    evals_by_id = {e["id"]: e for e in evals}
+    labels = {eid: f"#{eid} | {e['candidate_name']} | {e['level_path']}" for eid, e in evals_by_id.items()}
     eval_id = st.selectbox(
         "Select evaluation awaiting approval",
-        options=[e["id"] for e in evals],
-        format_func=lambda eid: f"#{eid} | {db.get_evaluation(eid)['candidate_name']} | {db.get_evaluation(eid)['level_path']}"
+        options=list(labels),
+        format_func=labels.get
     )
-    ev = db.get_evaluation(int(eval_id))
+    ev = evals_by_id.get(eval_id)
     if not ev:
         st.error("Evaluation not found.")
         return
@@ -32,34 +37,32 @@ def approver_page():
     st.write(f"**Target Level:** {ev['target_level']}")
     st.write(f"**Status:** {ev['status']}")
 
-    responses = db.list_responses_for_evaluation(int(eval_id))
+    bundle = db.get_evaluation_bundle(eval_id)
+    responses = bundle["responses"]
     if not responses:
         st.warning("No evaluator submissions yet.")
         return
 
     st.subheader("Evaluator votes (details)")
-    rows = []
-    for r in responses:
-        dims = [r["dim1"], r["dim2"], r["dim3"], r["dim4"], r["dim5"], r["dim6"], r["dim7"], r["dim8"]]
-        row = {
-            "Evaluator": r["full_name"],
-            "Role": r["evaluator_role"],
-            "SubmittedAt": r["submitted_at"],
-        }
-        for i, dim_name in enumerate(rules.dimensions[:8]):
-            row[dim_name] = dims[i]
-        rows.append(row)
-
-    st.dataframe(pd.DataFrame(rows), use_container_width=True)
+    votes = ui_tables.rows_frame(responses, ["full_name", "evaluator_role", "submitted_at", *logic.DIM_COLUMNS])
+    votes = ui_tables.rating_columns(votes)
+    votes = votes.rename(columns={
+        "full_name": "Evaluator",
+        "evaluator_role": "Role",
+        "submitted_at": "SubmittedAt",
+        **dict(zip(logic.DIM_COLUMNS, dim_names)),
+    })
+
+    st.dataframe(votes, use_container_width=True)
 
     st.subheader("Committee aggregation (decision support)")
-    agg = logic.committee_aggregate(int(eval_id))
+    agg = logic.aggregate_committee(bundle["evaluation"], bundle["assignments"], responses)
     if agg["committee_decision"] == "Pending":
         st.warning(f"Pending submissions: {agg['responded_count']}/{agg['assigned_count']}")
         return
 
     if agg["per_dim"]:
-        critical_idxs = set(rules.critical_by_path.get(ev["level_path"], []))
+        critical_idxs = frozenset(rules.critical_by_path.get(ev["level_path"], ()))
         agg_df = pd.DataFrame(
             [
                 {
@@ -74,7 +77,7 @@ def approver_page():
         st.dataframe(agg_df, use_container_width=True)
 
     st.subheader("Submit your final per-dimension decision")
-    existing = db.get_approver_response(int(eval_id))
+    existing = db.get_approver_response(eval_id)
     if existing:
         defaults = [existing["dim1"], existing["dim2"], existing["dim3"], existing["dim4"],
                     existing["dim5"], existing["dim6"], existing["dim7"], existing["dim8"]]
@@ -83,10 +86,21 @@ def approver_page():
         defaults = ["Partially Demonstrated"] * 8
         existing_comment = ""
 
-    final_dims = []
-    for i, dim_name in enumerate(rules.dimensions[:8]):
-        idx = logic.RATING_OPTIONS.index(defaults[i]) if defaults[i] in logic.RATING_OPTIONS else 1
-        final_dims.append(st.radio(dim_name, logic.RATING_OPTIONS, index=idx, key=f"appr_dim_{i}"))
+    ratings = pd.DataFrame({
+        "Dimension": dim_names,
+        "Rating": [v if v in logic.RATING_OPTIONS else "Partially Demonstrated" for v in defaults],
+    })
+    edited = st.data_editor(
+        ratings,
+        column_config={
+            "Rating": st.column_config.SelectboxColumn("Rating", options=logic.RATING_OPTIONS, required=True),
+        },
+        disabled=["Dimension"],
+        hide_index=True,
+        use_container_width=True,
+        key=f"appr_ratings_{eval_id}",
+    )
+    final_dims = edited["Rating"].tolist()
 
     comment = st.text_area("Optional approver comment", value=existing_comment)
 
@@ -95,11 +109,12 @@ def approver_page():
             st.error("Expected 8 dimensions from Sheet2 (A12:A19).")
             return
 
-        db.upsert_approver_response(int(eval_id), user["id"], final_dims, comment)
+        db.upsert_approver_response(eval_id, user["id"], final_dims, comment)
 
-        appr = logic.approver_final_decision(int(eval_id))
-        db.set_decision(int(eval_id), final_decision=appr["final_decision"], decided_by=user["id"])
-        db.set_evaluation_status(int(eval_id), "CLOSED")
+        appr = logic.approver_final_decision(eval_id)
+        db.set_decision(eval_id, final_decision=appr["final_decision"], decided_by=user["id"])
+        db.set_evaluation_status(eval_id, "CLOSED")
+        cache.clear_evaluations()
 
         st.success(f"Final decision saved: {appr['final_decision']} (evaluation closed)")
         st.rerun()
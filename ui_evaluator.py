@@ -1,7 +1,8 @@
 import streamlit as st
 import auth
-import db
+import cache
 import logic
+import ui_rating_form
 
 
 def evaluator_page():
@@ -17,25 +18,31 @@ def evaluator_page():
 
     rules = logic.get_rules()
 
-    evals = db.list_assigned_evaluations_for_user(user["id"])
+    evals = cache.assigned_evaluations(user["id"])
     if not evals:
         st.info("No assigned evaluations.")
         return
 
+    _assigned_evaluation(user, evals, rules)
+
+
+# a fragment: rating changes rerun only this block, not the page's auth and list queries
+@st.fragment
+def _assigned_evaluation(user, evals, rules):
+    evals_by_id = {e["id"]: e for e in evals}
+    labels = {eid: f"#{eid} | {e['candidate_name']} | {e['level_path']} | {e['status']}" for eid, e in evals_by_id.items()}
     eval_id = st.selectbox(
         "Select assigned evaluation",
-        options=[e["id"] for e in evals],
-        format_func=lambda eid: (
-            f"#{eid} | {db.get_evaluation(eid)['candidate_name']} | "
-            f"{db.get_evaluation(eid)['level_path']} | {db.get_evaluation(eid)['status']}"
-        )
+        options=list(labels),
+        format_func=labels.get
     )
-    ev = db.get_evaluation(int(eval_id))
+    ev = evals_by_id.get(eval_id)
     if not ev:
         st.error("Evaluation not found.")
         return
 
-    assign = db.get_assignment(int(eval_id), user["id"])
+    mine = cache.user_evaluation_bundle(eval_id, user["id"])
+    assign = mine["assignment"]
     if not assign:
         st.error("You are not assigned to this evaluation.")
         return
@@ -48,7 +55,7 @@ def evaluator_page():
         f"({logic.get_weight(ev['level_path'], assign['evaluator_role']):.0%})"
     )
 
-    existing = db.get_response(int(eval_id), user["id"])
+    existing = mine["response"]
     already_submitted = existing is not None
 
     if already_submitted:
@@ -61,27 +68,4 @@ def evaluator_page():
 
     st.markdown("### Provide your ratings")
 
-    if existing:
-        default_vals = [
-            existing["dim1"], existing["dim2"], existing["dim3"], existing["dim4"],
-            existing["dim5"], existing["dim6"], existing["dim7"], existing["dim8"]
-        ]
-        existing_comment = existing["comment"] or ""
-    else:
-        default_vals = ["Partially Demonstrated"] * 8
-        existing_comment = ""
-
-    dims = []
-    for i, dim_name in enumerate(rules.dimensions[:8]):
-        idx = logic.RATING_OPTIONS.index(default_vals[i]) if default_vals[i] in logic.RATING_OPTIONS else 1
-        v = st.radio(dim_name, logic.RATING_OPTIONS, index=idx, key=f"dim_{i}", disabled=already_submitted)
-        dims.append(v)
-
-    comment = st.text_area("Optional comment", value=existing_comment, disabled=already_submitted)
-
-    submit_clicked = st.button("Submit", type="primary", disabled=already_submitted)
-
-    if submit_clicked:
-        db.upsert_response(int(eval_id), user["id"], dims, comment)
-        st.success("✅ Submitted successfully. Thank you!")
-        st.rerun()
+    ui_rating_form.rating_form(eval_id, user["id"], existing, already_submitted, rules, key_prefix="")
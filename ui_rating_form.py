@@ -0,0 +1,56 @@
+import streamlit as st
+import pandas as pd
+
+import cache
+import db
+import logic
+
+
+# Ratings grid + comment + Submit, shared by the evaluator page and the HRBP
+# "My Evaluations" tab. Both call it from inside their own st.fragment, so
+# edits here rerun only that fragment.
+def rating_form(eval_id: int, user_id: int, existing, readonly: bool, rules, key_prefix: str):
+    # read-only: one static table instead of a disabled grid, text box and button
+    if readonly:
+        if not existing:
+            st.info("No response was submitted.")
+            return
+        st.table(pd.DataFrame({
+            "Dimension": rules.dimensions[:8],
+            "Your rating": [existing[c] for c in logic.DIM_COLUMNS],
+        }))
+        st.write(f"**Comment:** {existing['comment'] or '—'}")
+        return
+
+    if existing:
+        default_vals = [existing[c] for c in logic.DIM_COLUMNS]
+        default_comment = existing["comment"] or ""
+    else:
+        default_vals = ["Partially Demonstrated"] * 8
+        default_comment = ""
+
+    # one grid widget instead of eight radios; inside a form, rating and comment
+    # edits stay in the browser until Submit
+    ratings = pd.DataFrame({
+        "Dimension": rules.dimensions[:8],
+        "Rating": [v if v in logic.RATING_OPTIONS else "Partially Demonstrated" for v in default_vals],
+    })
+    with st.form(f"{key_prefix}rating_form_{eval_id}"):
+        edited = st.data_editor(
+            ratings,
+            column_config={
+                "Rating": st.column_config.SelectboxColumn("Rating", options=logic.RATING_OPTIONS, required=True),
+            },
+            disabled=["Dimension"],
+            hide_index=True,
+            use_container_width=True,
+            key=f"{key_prefix}ratings_{eval_id}",
+        )
+        comment = st.text_area("Optional comment", value=default_comment, key=f"{key_prefix}comment_{eval_id}")
+        submitted = st.form_submit_button("Submit", type="primary")
+
+    if submitted:
+        db.upsert_response(eval_id, user_id, edited["Rating"].tolist(), comment)
+        cache.user_evaluation_bundle.clear()
+        st.success("✅ Submitted successfully.")
+        st.rerun()
@@ -0,0 +1,22 @@
+import pandas as pd
+
+import logic
+
+# rating columns in report frames: int8 codes, sent to the browser as an Arrow dictionary
+RATING_UNKNOWN = "Unknown"
+RATING_DTYPE = pd.CategoricalDtype([*logic.RATING_OPTIONS, RATING_UNKNOWN])
+
+
+def rows_frame(rows, columns) -> pd.DataFrame:
+    # sqlite3.Row is a sequence with keys(), so from_records reads it positionally (no per-row dicts)
+    frame = pd.DataFrame.from_records(rows, columns=rows[0].keys() if rows else columns)[columns]
+    return frame.convert_dtypes(dtype_backend="pyarrow")
+
+
+def rating_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    # the cast would turn a rating outside RATING_OPTIONS into NaN, so label those explicitly first
+    frame = frame.copy()
+    for col in logic.DIM_COLUMNS:
+        values = frame[col].astype(object)
+        frame[col] = values.where(values.isin(logic.RATING_OPTIONS), RATING_UNKNOWN).astype(RATING_DTYPE)
+    return frame